@@ -16,74 +16,225 @@ Example (CI with OIDC credentials):
 
 import time
 import argparse
+import hashlib
+import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import boto3
+from botocore.exceptions import WaiterError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# CloudFormation waiter polling. The boto3 defaults (30s delay, 120 attempts)
+# leave up to 30s of idle time after a small stack finishes; poll more often
+# and raise the attempt count so the overall one-hour timeout is unchanged.
+DEFAULT_POLL_DELAY = 5
+DEFAULT_MAX_ATTEMPTS = 720
+
+# change_set_create_complete waiter polling (10 minutes overall); change sets
+# are usually computed within seconds
+CHANGE_SET_POLL_DELAY = 3
+CHANGE_SET_MAX_ATTEMPTS = 200
+
+# Template parameter and stack output recording the hash of the deployed
+# template and parameters. An output, unlike a stack tag, is not propagated to
+# the stack's resources.
+CONFIG_HASH_KEY = "ConfigHash"
+
+# Stack statuses in which the deployed outputs reflect a completed deploy
+STABLE_STACK_STATUSES = ("CREATE_COMPLETE", "UPDATE_COMPLETE")
+
+# ACM certificate_validated waiter polling (15 minutes overall).
+CERTIFICATE_POLL_DELAY = 5
+CERTIFICATE_MAX_ATTEMPTS = 180
 
-def validate_template(client, template_body):
+
+def poll_until(fn, initial=2, cap=30, max_total=900):
+    """
+    Call fn until it returns a truthy value, backing off between attempts.
+
+    The delay starts at initial seconds and grows by 1.5x per attempt up to cap.
+
+    Args:
+        fn: Zero-argument callable polled for a result.
+        initial: Seconds to wait after the first unsuccessful attempt.
+        cap: Maximum seconds to wait between attempts.
+        max_total: Maximum seconds to keep polling before giving up.
+
+    Returns:
+        The first truthy value returned by fn.
+
+    Raises:
+        TimeoutError: If fn does not succeed within max_total seconds.
+    """
+    deadline = time.monotonic() + max_total
+    delay = initial
+    while True:
+        result = fn()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Polling timed out after {max_total} seconds")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, cap)
+
+
+def validate_template(client, template):
     """
     Validate the CloudFormation template.
 
     Args:
         client: boto3 CloudFormation client.
-        template_body: The CloudFormation template body as a string.
+        template: Template source, either {"TemplateBody": ...} or
+            {"TemplateURL": ...}.
 
     Returns:
         dict: Validation response from CloudFormation.
     """
-    logger.info("Validating template... %s", template_body)
-    response = client.validate_template(TemplateBody=template_body)
+    logger.info("Validating template... %s", template)
+    response = client.validate_template(**template)
     logger.info("Template validation response: %s", response)
     return response
 
 
-def deploy_stack(client, stack_name, template_body, parameters):
+def config_hash(template, parameters):
+    """
+    Compute a hash identifying a template source and parameter set.
+
+    Args:
+        template: Template source, either {"TemplateBody": ...} or
+            {"TemplateURL": ...}.
+        parameters: List of parameters to pass to the stack.
+
+    Returns:
+        str: Hex SHA-256 digest, independent of parameter order.
+    """
+    payload = json.dumps(
+        {
+            "template": template,
+            "parameters": sorted(parameters, key=lambda p: p["ParameterKey"]),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def deploy_stack(client, stack_name, template, parameters, waiter_config=None):
     """
     Deploy or update a CloudFormation stack.
 
+    A hash of the template and parameters is passed as the ConfigHash
+    parameter, which the template echoes in a ConfigHash output. The update is
+    skipped entirely when a stable stack already reports the same hash. Other
+    updates go through a change set that is only executed if it has changes.
+
     Args:
         client: boto3 CloudFormation client.
         stack_name: Name of the stack to deploy or update.
-        template_body: The CloudFormation template body as a string.
+        template: Template source, either {"TemplateBody": ...} or
+            {"TemplateURL": ...}.
         parameters: List of parameters to pass to the stack.
+        waiter_config: Optional WaiterConfig dict (Delay, MaxAttempts) for the
+            stack waiters. Defaults to DEFAULT_POLL_DELAY/DEFAULT_MAX_ATTEMPTS.
     """
+    if waiter_config is None:
+        waiter_config = {
+            "Delay": DEFAULT_POLL_DELAY,
+            "MaxAttempts": DEFAULT_MAX_ATTEMPTS,
+        }
+    deployed_hash = config_hash(template, parameters)
+    stack_args = {
+        "StackName": stack_name,
+        **template,
+        "Parameters": [
+            *parameters,
+            {"ParameterKey": CONFIG_HASH_KEY, "ParameterValue": deployed_hash},
+        ],
+        "Capabilities": ["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"],
+    }
     try:
         logger.info("Checking if stack %s exists...", stack_name)
-        client.describe_stacks(StackName=stack_name)
-        logger.info("Stack %s exists. Updating...", stack_name)
-        try:
-            client.update_stack(
-                StackName=stack_name,
-                TemplateBody=template_body,
-                Parameters=parameters,
-                Capabilities=["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"],
-            )
-            waiter = client.get_waiter("stack_update_complete")
-            waiter.wait(StackName=stack_name)
-            logger.info("Stack %s updated successfully.", stack_name)
-        except client.exceptions.ClientError as e:
-            if "No updates are to be performed" in str(e):
-                logger.info("No updates detected for stack %s.", stack_name)
-            else:
-                raise
+        response = client.describe_stacks(StackName=stack_name)
     except client.exceptions.ClientError as e:
-        if "does not exist" in str(e):
-            logger.info("Stack %s does not exist. Creating...", stack_name)
-            client.create_stack(
-                StackName=stack_name,
-                TemplateBody=template_body,
-                Parameters=parameters,
-                Capabilities=["CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND"],
-            )
-            waiter = client.get_waiter("stack_create_complete")
-            waiter.wait(StackName=stack_name)
-            logger.info("Stack %s created successfully.", stack_name)
-        else:
+        if "does not exist" not in str(e):
+            raise
+        logger.info("Stack %s does not exist. Creating...", stack_name)
+        client.create_stack(**stack_args)
+        waiter = client.get_waiter("stack_create_complete")
+        waiter.wait(StackName=stack_name, WaiterConfig=waiter_config)
+        logger.info("Stack %s created successfully.", stack_name)
+        return
+
+    stack = response["Stacks"][0]
+    outputs = {
+        output["OutputKey"]: output["OutputValue"]
+        for output in stack.get("Outputs", [])
+    }
+    # A failed or rolled-back stack must go through a real update even when
+    # it was created or last attempted with the same inputs
+    if (
+        stack["StackStatus"] in STABLE_STACK_STATUSES
+        and outputs.get(CONFIG_HASH_KEY) == deployed_hash
+    ):
+        logger.info("No changes for stack %s (config hash matches).", stack_name)
+        return
+    logger.info("Stack %s exists. Updating...", stack_name)
+    if update_stack_with_change_set(client, stack_args, waiter_config):
+        logger.info("Stack %s updated successfully.", stack_name)
+    else:
+        logger.info("No updates detected for stack %s.", stack_name)
+
+
+def update_stack_with_change_set(client, stack_args, waiter_config):
+    """
+    Update a stack through a change set, executing it only if it has changes.
+
+    CloudFormation reports an empty change set as FAILED as soon as it has been
+    computed, so no-op deploys return without waiting on a stack update.
+
+    Args:
+        client: boto3 CloudFormation client.
+        stack_args: create_stack/update_stack arguments (StackName, template
+            source, Parameters, Capabilities).
+        waiter_config: WaiterConfig dict for the stack_update_complete waiter.
+
+    Returns:
+        bool: True if the change set was executed, False if it was empty.
+    """
+    stack_name = stack_args["StackName"]
+    change_set_name = f"deploy-{int(time.time())}"
+    client.create_change_set(
+        **stack_args, ChangeSetName=change_set_name, ChangeSetType="UPDATE"
+    )
+    try:
+        waiter = client.get_waiter("change_set_create_complete")
+        waiter.wait(
+            StackName=stack_name,
+            ChangeSetName=change_set_name,
+            WaiterConfig={
+                "Delay": CHANGE_SET_POLL_DELAY,
+                "MaxAttempts": CHANGE_SET_MAX_ATTEMPTS,
+            },
+        )
+    except WaiterError:
+        change_set = client.describe_change_set(
+            StackName=stack_name, ChangeSetName=change_set_name
+        )
+        reason = change_set.get("StatusReason", "")
+        if "didn't contain changes" not in reason and "No updates" not in reason:
             raise
+        client.delete_change_set(StackName=stack_name, ChangeSetName=change_set_name)
+        return False
+
+    client.execute_change_set(StackName=stack_name, ChangeSetName=change_set_name)
+    waiter = client.get_waiter("stack_update_complete")
+    waiter.wait(StackName=stack_name, WaiterConfig=waiter_config)
+    return True
 
 
 def get_existing_certificate(domain, acm_client):
@@ -95,52 +246,142 @@ def get_existing_certificate(domain, acm_client):
         acm_client: Boto3 ACM client.
 
     Returns:
-        str: ACM Certificate ARN if found and valid, None otherwise.
+        tuple: (ACM Certificate ARN, status) of the certificate found, or
+            (None, None) if there is none.
     """
-    response = acm_client.list_certificates(
-        CertificateStatuses=["ISSUED", "PENDING_VALIDATION"]
+    # Certificate summaries carry the status and SANs, so candidates can be
+    # checked in-list without a describe_certificate call each
+    paginator = acm_client.get_paginator("list_certificates")
+    pages = paginator.paginate(
+        CertificateStatuses=["ISSUED", "PENDING_VALIDATION"],
+        PaginationConfig={"MaxItems": 1000},
     )
 
-    for cert in response.get("CertificateSummaryList", []):
-        if cert["DomainName"] == domain:
+    # Prefer an issued certificate; fall back to the first pending one
+    pending_arn = None
+    for page in pages:
+        for cert in page.get("CertificateSummaryList", []):
+            if cert["DomainName"] != domain:
+                continue
+            if pending_arn and cert["Status"] != "ISSUED":
+                continue
             cert_arn = cert["CertificateArn"]
             # Verify the certificate includes www subdomain
-            cert_details = acm_client.describe_certificate(CertificateArn=cert_arn)
-            sans = cert_details["Certificate"].get("SubjectAlternativeNames", [])
-            if f"www.{domain}" in sans:
-                status = cert_details["Certificate"]["Status"]
-                if status == "ISSUED":
-                    logger.info("Found existing valid certificate: %s", cert_arn)
-                    return cert_arn
-                logger.info(
-                    "Found existing certificate (status: %s): %s", status, cert_arn
-                )
-                return cert_arn
-    return None
+            sans = cert.get("SubjectAlternativeNameSummaries", [])
+            if f"www.{domain}" not in sans and cert.get(
+                "HasAdditionalSubjectAlternativeNames"
+            ):
+                # Summaries list at most 100 SANs; check the full list
+                cert_details = acm_client.describe_certificate(CertificateArn=cert_arn)
+                sans = cert_details["Certificate"].get("SubjectAlternativeNames", [])
+            if f"www.{domain}" not in sans:
+                continue
+            if cert["Status"] == "ISSUED":
+                logger.info("Found existing valid certificate: %s", cert_arn)
+                return cert_arn, "ISSUED"
+            pending_arn = cert_arn
+
+    if pending_arn:
+        logger.info(
+            "Found existing certificate (status: PENDING_VALIDATION): %s", pending_arn
+        )
+        return pending_arn, "PENDING_VALIDATION"
+    return None, None
+
+
+def get_hosted_zone_id(domain, route53_client):
+    """
+    Look up the Route 53 hosted zone ID for the domain.
+
+    Args:
+        domain: The domain name.
+        route53_client: Boto3 Route 53 client.
+
+    Returns:
+        str: Hosted zone ID, without the /hostedzone/ prefix.
+
+    Raises:
+        ValueError: If no hosted zone exists for the domain.
+    """
+    zone_id_response = route53_client.list_hosted_zones_by_name(
+        DNSName=domain, MaxItems="1"
+    )
+    hosted_zones = zone_id_response.get("HostedZones", [])
+    if not hosted_zones or domain not in hosted_zones[0]["Name"]:
+        raise ValueError(f"No hosted zone found for domain {domain}")
+    return hosted_zones[0]["Id"].split("/")[-1]
+
+
+def read_template(template_path):
+    """
+    Read a CloudFormation template from disk.
+
+    Args:
+        template_path: Path to the template file.
+
+    Returns:
+        str: The template body.
+    """
+    with open(template_path, "r", encoding="utf-8") as file:
+        return file.read()
+
+
+def prepare_deploy_inputs(domain, route53_client, acm_client, template_path):
+    """
+    Gather the hosted zone ID, ACM certificate and template body for a deploy.
+
+    The hosted zone lookup, existing certificate check and template read do not
+    depend on each other, so they run concurrently. Each result is collected
+    only when it is needed, which lets the template read overlap the
+    certificate request as well.
+
+    Args:
+        domain: The domain name.
+        route53_client: Boto3 Route 53 client.
+        acm_client: Boto3 ACM client.
+        template_path: Path to the CloudFormation template.
+
+    Returns:
+        tuple: (hosted zone ID, ACM certificate ARN, template body).
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        zone_future = executor.submit(get_hosted_zone_id, domain, route53_client)
+        cert_future = executor.submit(get_existing_certificate, domain, acm_client)
+        template_future = executor.submit(read_template, template_path)
+
+        hosted_zone_id = zone_future.result()
+        existing_arn, existing_status = cert_future.result()
+        if existing_status == "ISSUED":
+            # The certificate list already reported it issued; use it as is
+            acm_certificate_arn = existing_arn
+        else:
+            acm_certificate_arn = request_acm_certificate(
+                domain, hosted_zone_id, acm_client, route53_client, existing_arn
+            )
+        return hosted_zone_id, acm_certificate_arn, template_future.result()
 
 
-def request_acm_certificate(domain, zone_id, acm_client, route53_client):
+def request_acm_certificate(
+    domain, zone_id, acm_client, route53_client, existing_cert=None
+):
     """
     Request an ACM certificate for the domain and validate it using Route 53.
-    First checks for an existing valid certificate.
+    Reuses an existing certificate when one is provided.
 
     Args:
         domain: The domain name.
         zone_id: Hosted zone ID for the domain.
         acm_client: Boto3 ACM client.
         route53_client: Boto3 Route 53 client.
+        existing_cert: ARN of an existing certificate pending validation, or
+            None to request a new certificate.
 
     Returns:
         str: ACM Certificate ARN.
     """
-    # Check for existing certificate first
-    existing_cert = get_existing_certificate(domain, acm_client)
     if existing_cert:
-        # If certificate is already issued, return it
-        cert_details = acm_client.describe_certificate(CertificateArn=existing_cert)
-        if cert_details["Certificate"]["Status"] == "ISSUED":
-            return existing_cert
-        # If pending validation, continue with validation process
+        # Continue with the validation process; if the certificate has been
+        # issued in the meantime, the validation options check returns early
         cert_arn = existing_cert
         logger.info("Using existing certificate pending validation: %s", cert_arn)
     else:
@@ -154,53 +395,63 @@ def request_acm_certificate(domain, zone_id, acm_client, route53_client):
         logger.info("Certificate requested with ARN: %s", cert_arn)
 
     # Retrieve validation options
-    while True:
+    def validation_options_ready():
         cert_details = acm_client.describe_certificate(CertificateArn=cert_arn)
-        cert_status = cert_details["Certificate"]["Status"]
-
-        # If already issued, no need to validate
-        if cert_status == "ISSUED":
-            logger.info("Certificate already issued.")
-            return cert_arn
-
         options = cert_details["Certificate"].get("DomainValidationOptions", [])
-        if options and "ResourceRecord" in options[0]:
-            break
+        if cert_details["Certificate"]["Status"] == "ISSUED" or (
+            options and "ResourceRecord" in options[0]
+        ):
+            return cert_details
         logger.info("Waiting for validation options to become available...")
-        time.sleep(5)
+        return None
 
-    # Create DNS validation records for all domains
+    cert_details = poll_until(validation_options_ready)
+
+    # If already issued, no need to validate
+    if cert_details["Certificate"]["Status"] == "ISSUED":
+        logger.info("Certificate already issued.")
+        return cert_arn
+    options = cert_details["Certificate"]["DomainValidationOptions"]
+
+    # Create DNS validation records for all domains in a single change batch.
+    # ACM often returns the same CNAME for the apex and www names.
+    records = {}
     for option in options:
         validation_record = option["ResourceRecord"]
-        route53_client.change_resource_record_sets(
-            HostedZoneId=zone_id,
-            ChangeBatch={
-                "Changes": [
-                    {
-                        "Action": "UPSERT",
-                        "ResourceRecordSet": {
-                            "Name": validation_record["Name"],
-                            "Type": validation_record["Type"],
-                            "TTL": 300,
-                            "ResourceRecords": [{"Value": validation_record["Value"]}],
-                        },
-                    }
-                ]
-            },
-        )
-        logger.info(
-            "Validation record created for %s in Route 53.", validation_record["Name"]
+        records[(validation_record["Name"], validation_record["Type"])] = (
+            validation_record["Value"]
         )
+    route53_client.change_resource_record_sets(
+        HostedZoneId=zone_id,
+        ChangeBatch={
+            "Changes": [
+                {
+                    "Action": "UPSERT",
+                    "ResourceRecordSet": {
+                        "Name": name,
+                        "Type": record_type,
+                        "TTL": 300,
+                        "ResourceRecords": [{"Value": value}],
+                    },
+                }
+                for (name, record_type), value in records.items()
+            ]
+        },
+    )
+    for name, _ in records:
+        logger.info("Validation record created for %s in Route 53.", name)
 
     # Wait for certificate validation
-    while True:
-        cert_details = acm_client.describe_certificate(CertificateArn=cert_arn)
-        status = cert_details["Certificate"]["Status"]
-        if status == "ISSUED":
-            logger.info("Certificate issued successfully.")
-            break
-        logger.info("Waiting for certificate validation (status: %s)...", status)
-        time.sleep(15)
+    logger.info("Waiting for certificate validation...")
+    waiter = acm_client.get_waiter("certificate_validated")
+    waiter.wait(
+        CertificateArn=cert_arn,
+        WaiterConfig={
+            "Delay": CERTIFICATE_POLL_DELAY,
+            "MaxAttempts": CERTIFICATE_MAX_ATTEMPTS,
+        },
+    )
+    logger.info("Certificate issued successfully.")
 
     return cert_arn
 
@@ -224,6 +475,35 @@ def get_kms_key(client, alias_name):
     return None
 
 
+def upload_template(s3_client, bucket_name, key_prefix, template_body):
+    """
+    Upload a CloudFormation template to S3 so stacks can reference it by URL.
+
+    The object key is derived from the template content, so the URL changes
+    whenever the template does.
+
+    Args:
+        s3_client: Boto3 S3 client.
+        bucket_name: The S3 bucket name.
+        key_prefix: Key prefix to store the template under.
+        template_body: The CloudFormation template body as a string.
+
+    Returns:
+        str: HTTPS URL of the uploaded template.
+    """
+    template_bytes = template_body.encode("utf-8")
+    key = f"{key_prefix}/{hashlib.sha256(template_bytes).hexdigest()}.yaml"
+    logger.info("Uploading template to s3://%s/%s...", bucket_name, key)
+    s3_client.put_object(
+        Bucket=bucket_name,
+        Key=key,
+        Body=template_bytes,
+        ContentType="application/x-yaml",
+    )
+    region = s3_client.meta.region_name
+    return f"https://{bucket_name}.s3.{region}.amazonaws.com/{key}"
+
+
 def upload_index_html(s3_client, bucket_name, file_path):
     """
     Upload index.html to the specified S3 bucket.
@@ -240,9 +520,12 @@ def upload_index_html(s3_client, bucket_name, file_path):
     logger.info("Uploaded %s to bucket %s as %s.", file_path, bucket_name, file_path)
 
 
-def main():
+def parse_args():
     """
-    Main function to deploy the CloudFormation stack for the website framework.
+    Parse command-line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
     """
     parser = argparse.ArgumentParser(
         description="Deploy CloudFormation stack for website framework."
@@ -279,8 +562,33 @@ def main():
         action="store_true",
         help="Validate the CloudFormation template instead of deploying.",
     )
+    parser.add_argument(
+        "--poll-delay",
+        type=int,
+        default=DEFAULT_POLL_DELAY,
+        help=f"Seconds between stack status polls. Default is {DEFAULT_POLL_DELAY}.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_MAX_ATTEMPTS,
+        help=f"Maximum stack status polls before timing out. Default is {DEFAULT_MAX_ATTEMPTS}.",
+    )
+    parser.add_argument(
+        "--template-bucket",
+        default=None,
+        help="S3 bucket to stage the template in and pass to CloudFormation by URL. "
+        "Default is to send the template body inline.",
+    )
 
-    args = parser.parse_args()
+    return parser.parse_args()
+
+
+def main():
+    """
+    Main function to deploy the CloudFormation stack for the website framework.
+    """
+    args = parse_args()
 
     # Configure AWS session (use profile if provided, otherwise use default credential chain)
     if args.account:
@@ -292,36 +600,35 @@ def main():
     acm_client = boto3.client("acm")
     s3_client = boto3.client("s3")
 
-    # Get hosted zone ID
-    domain = args.domain
-    zone_id_response = route53_client.list_hosted_zones_by_name(
-        DNSName=domain, MaxItems="1"
-    )
-    hosted_zones = zone_id_response.get("HostedZones", [])
-    if not hosted_zones or domain not in hosted_zones[0]["Name"]:
-        raise ValueError(f"No hosted zone found for domain {domain}")
-    hosted_zone_id = hosted_zones[0]["Id"].split("/")[-1]
-
-    # Request ACM certificate
-    acm_certificate_arn = request_acm_certificate(
-        domain, hosted_zone_id, acm_client, route53_client
+    # Look up the hosted zone, obtain the ACM certificate and read the template
+    hosted_zone_id, acm_certificate_arn, template_body = prepare_deploy_inputs(
+        args.domain, route53_client, acm_client, "cfn-website-framework.yaml"
     )
 
-    # Read the CloudFormation template
-    with open("cfn-website-framework.yaml", "r", encoding="utf-8") as file:
-        template_body = file.read()
+    # Stage the template in S3 if requested, otherwise send it inline
+    stack_name = f"{args.prefix}-website-framework"
+    if args.template_bucket:
+        template = {
+            "TemplateURL": upload_template(
+                s3_client,
+                args.template_bucket,
+                f"{stack_name}/cfn-website-framework",
+                template_body,
+            )
+        }
+    else:
+        template = {"TemplateBody": template_body}
 
     # Validate the template if requested
     if args.validate:
-        validate_template(cfn_client, template_body)
+        validate_template(cfn_client, template)
         return
 
     # Deploy the stack
-    stack_name = f"{args.prefix}-website-framework"
     deploy_stack(
         cfn_client,
         stack_name=stack_name,
-        template_body=template_body,
+        template=template,
         parameters=[
             {
                 "ParameterKey": "ACMCertificateArn",
@@ -339,11 +646,18 @@ def main():
             },
             {"ParameterKey": "HostedZoneId", "ParameterValue": hosted_zone_id},
         ],
+        waiter_config={"Delay": args.poll_delay, "MaxAttempts": args.max_attempts},
     )
 
-    # Upload html to S3
-    upload_index_html(s3_client, args.domain, "index.html")
-    upload_index_html(s3_client, args.domain, "resume.html")
+    # Upload html to S3 (boto3 clients are thread-safe, so share s3_client)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        # Consume the results so any upload error is raised here
+        list(
+            executor.map(
+                partial(upload_index_html, s3_client, args.domain),
+                ["index.html", "resume.html"],
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -6,12 +6,21 @@ and sends an email via Amazon SES.
 """
 
 import base64
+import hashlib
+import html
 import json
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from html.parser import HTMLParser
+from string import Template
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -23,37 +32,122 @@ RECIPIENT_EMAIL = os.environ.get("RECIPIENT_EMAIL")
 SENDER_EMAIL = os.environ.get("SENDER_EMAIL")
 ALLOWED_ORIGIN = os.environ.get("ALLOWED_ORIGIN", "*")
 
-# SES client
-ses_client = boto3.client("ses")
+# Response headers, shared by every response unless an origin override is given.
+# Responses hold a reference to this dict, so they must not be modified in place.
+BASE_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": ALLOWED_ORIGIN,
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Allow-Methods": "POST, OPTIONS",
+}
+
+
+# SES client, created on first use to keep botocore model loading out of the
+# cold start init phase; warm invocations reuse the kept-alive connection
+@lru_cache(maxsize=1)
+def get_ses_client():
+    """Return the shared SES client."""
+    return boto3.Session().client(
+        "ses",
+        config=Config(
+            retries={"total_max_attempts": 2, "mode": "standard"},
+            tcp_keepalive=True,
+        ),
+    )
+
 
 # Email regex pattern
-EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+EMAIL_REGEX = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Form field length limits
+MAX_FIELD_LENGTH = 5000
+MIN_NAME_LENGTH = 2
+MIN_MESSAGE_LENGTH = 10
+
+# Identical submissions within this window are acknowledged but not re-sent
+DUPLICATE_WINDOW_SECONDS = 60
+MAX_RECENT_SUBMISSIONS = 256
+
+# Submission digest -> time it was sent, oldest first (per warm container)
+_recent_submissions = OrderedDict()
+
+# Email body templates, built once per container and filled in per request
+EMAIL_TEXT_TEMPLATE = Template(
+    """
+New contact form submission:
+
+Name: $name
+Email: $email
+
+Message:
+$message
+"""
+)
+EMAIL_HTML_TEMPLATE = Template(
+    """
+<html>
+<head></head>
+<body>
+<h2>New Contact Form Submission</h2>
+<p><strong>Name:</strong> $name</p>
+<p><strong>Email:</strong> <a href="mailto:$email">$email</a></p>
+<h3>Message:</h3>
+<p>$message</p>
+</body>
+</html>
+"""
+)
 
 
 def validate_email(email):
     """Validate email format."""
-    return bool(EMAIL_REGEX.match(email))
+    return EMAIL_REGEX.fullmatch(email) is not None
+
+
+class TagStripper(HTMLParser):
+    """HTML parser that keeps text content and drops tags, comments and CDATA."""
+
+    def __init__(self):
+        # Decode character references in text so a bare "&" (as in "R&D") is
+        # passed through as typed; decoded "<" becomes literal text, and
+        # send_email escapes every field for the HTML body
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+    def strip(self, text):
+        """Return text with all markup removed."""
+        self.reset()
+        self.parts = []
+        self.feed(text)
+        self.close()
+        return "".join(self.parts)
+
+
+_parser_local = threading.local()
 
 
 def sanitize_input(text):
-    """Sanitize input by removing potentially harmful characters."""
+    """Strip HTML tags and decode character references ("&lt;b&gt;" becomes "<b>")."""
     if not text:
         return ""
-    # Remove HTML tags and limit length
-    sanitized = re.sub(r"<[^>]*>", "", str(text))
-    return sanitized[:5000]  # Limit to 5000 characters
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = TagStripper()
+    # Limit length before parsing to cap work, then remove HTML tags
+    return parser.strip(str(text)[:MAX_FIELD_LENGTH])
 
 
 def build_response(status_code, body, origin=None):
-    """Build HTTP response with CORS headers."""
+    """Build HTTP response with CORS headers; the headers dict may be shared, do not mutate it."""
+    headers = BASE_HEADERS
+    if origin:
+        headers = {**BASE_HEADERS, "Access-Control-Allow-Origin": origin}
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": origin or ALLOWED_ORIGIN,
-            "Access-Control-Allow-Headers": "Content-Type",
-            "Access-Control-Allow-Methods": "POST, OPTIONS",
-        },
+        "headers": headers,
         "body": json.dumps(body),
     }
 
@@ -61,30 +155,15 @@ def build_response(status_code, body, origin=None):
 def send_email(name, email, message):
     """Send email via SES."""
     subject = f"Contact Form Submission from {name}"
-    body_text = f"""
-New contact form submission:
-
-Name: {name}
-Email: {email}
-
-Message:
-{message}
-"""
-    body_html = f"""
-<html>
-<head></head>
-<body>
-<h2>New Contact Form Submission</h2>
-<p><strong>Name:</strong> {name}</p>
-<p><strong>Email:</strong> <a href="mailto:{email}">{email}</a></p>
-<h3>Message:</h3>
-<p>{message.replace(chr(10), '<br>')}</p>
-</body>
-</html>
-"""
+    body_text = EMAIL_TEXT_TEMPLATE.substitute(name=name, email=email, message=message)
+    body_html = EMAIL_HTML_TEMPLATE.substitute(
+        name=html.escape(name),
+        email=html.escape(email),
+        message=html.escape(message).replace("\n", "<br>"),
+    )
 
     try:
-        response = ses_client.send_email(
+        response = get_ses_client().send_email(
             Source=SENDER_EMAIL,
             Destination={"ToAddresses": [RECIPIENT_EMAIL]},
             Message={
@@ -103,38 +182,81 @@ Message:
         return False
 
 
+def submission_key(name, email, message):
+    """Return a digest identifying a submission."""
+    data = "\0".join((name, email, message)).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def is_duplicate_submission(key):
+    """Check whether a submission was already sent within the duplicate window."""
+    now = time.monotonic()
+    while _recent_submissions:
+        oldest_key, sent_at = next(iter(_recent_submissions.items()))
+        if now - sent_at < DUPLICATE_WINDOW_SECONDS:
+            break
+        del _recent_submissions[oldest_key]
+    return key in _recent_submissions
+
+
+def record_submission(key):
+    """Remember a sent submission for duplicate detection."""
+    _recent_submissions[key] = time.monotonic()
+    _recent_submissions.move_to_end(key)
+    if len(_recent_submissions) > MAX_RECENT_SUBMISSIONS:
+        _recent_submissions.popitem(last=False)
+
+
+def send_unique_email(name, email, message):
+    """Send email via SES unless the same submission was sent recently."""
+    key = submission_key(name, email, message)
+    if is_duplicate_submission(key):
+        logger.info("Duplicate submission ignored")
+        return True
+    if send_email(name, email, message):
+        record_submission(key)
+        return True
+    return False
+
+
 def parse_request_body(event):
     """Parse the request body from the event."""
-    raw_body = event.get("body", "")
-    if not raw_body:
-        return {}
-
+    raw_body = event.get("body") or ""
     if event.get("isBase64Encoded"):
-        raw_body = base64.b64decode(raw_body).decode("utf-8")
+        # json.loads accepts the decoded bytes directly
+        raw_body = base64.b64decode(raw_body)
 
-    return json.loads(raw_body)
+    return json.loads(raw_body) if raw_body else {}
 
 
 def validate_form_fields(name, email, message):
     """Validate form fields and return list of errors."""
+    # Fields come from sanitize_input, so they are always strings and an empty
+    # field fails the length check without a separate truthiness test
     errors = []
-    if not name or len(name) < 2:
-        errors.append("Name is required (minimum 2 characters)")
+    if len(name) < MIN_NAME_LENGTH:
+        errors.append(f"Name is required (minimum {MIN_NAME_LENGTH} characters)")
     if not email:
         errors.append("Email is required")
     elif not validate_email(email):
         errors.append("Invalid email format")
-    if not message or len(message) < 10:
-        errors.append("Message is required (minimum 10 characters)")
+    if len(message) < MIN_MESSAGE_LENGTH:
+        errors.append(f"Message is required (minimum {MIN_MESSAGE_LENGTH} characters)")
     return errors
 
 
 def handler(event, _context):
     """Lambda handler for contact form submissions."""
-    logger.info("Received event: %s", json.dumps(event))
+    method = event.get("requestContext", {}).get("http", {}).get("method")
+    logger.info(
+        "Received %s request (body length: %d)", method, len(event.get("body") or "")
+    )
+    # Only serialize the full event when debug logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received event: %s", json.dumps(event))
 
     # Handle OPTIONS preflight request
-    if event.get("requestContext", {}).get("http", {}).get("method") == "OPTIONS":
+    if method == "OPTIONS":
         return build_response(200, {"message": "OK"})
 
     # Parse request body
@@ -161,7 +283,7 @@ def handler(event, _context):
         return build_response(500, {"error": "Server configuration error"})
 
     # Send email
-    if send_email(name, email, message):
+    if send_unique_email(name, email, message):
         return build_response(
             200, {"message": "Thank you for your message. I will get back to you soon."}
         )
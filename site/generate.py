@@ -13,32 +13,139 @@ Example:
 """
 
 import argparse
+import os
+import pickle
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import yaml
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+# yaml and jinja2 are imported inside the functions that use them, so that
+# --help, argument errors and data cache hits skip their import cost
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Linux ioctl to share the source file's extents (reflink) on CoW filesystems
+FICLONE = 0x40049409
+
+# Buffer size for the portable user-space copy fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
+# Layout templates the pages extend, compiled up front along with the pages
+LAYOUT_TEMPLATES = ("base.html",)
+
+# Upper bound on worker threads for page rendering and static file copies
+MAX_WORKERS = 8
+
+# Jinja environments already built in this process, keyed by directories
+_ENV_CACHE = {}
 
 
 def load_resume_data(data_path):
-    """Load resume data from YAML file."""
-    with open(data_path, "r", encoding="utf-8") as file:
-        return yaml.safe_load(file)
+    """Load resume data from YAML file, reusing a cached parse if unchanged."""
+    data_path = Path(data_path)
+    cache_path = data_path.with_name(data_path.name + ".cache.pkl")
+    stat = data_path.stat()
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+
+    # Any failure to read or unpack the cache (missing, truncated, foreign or
+    # malformed pickle) just falls back to parsing the YAML
+    try:
+        with open(cache_path, "rb") as file:
+            cached_key, data = pickle.load(file)
+        if cached_key == cache_key:
+            return data
+    except Exception:  # pylint: disable=broad-exception-caught
+        pass
+
+    import yaml  # pylint: disable=import-outside-toplevel
+
+    # Use the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # Read the whole file in one call and let libyaml scan the UTF-8 bytes
+    # directly, instead of pulling chunks through a file object
+    data = yaml.load(data_path.read_bytes(), Loader=loader)
 
+    # Write the cache atomically so a concurrent build never reads a partial file
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as file:
+            pickle.dump((cache_key, data), file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as err:
+        print(
+            f"Warning: Could not write data cache {cache_path}: {err}", file=sys.stderr
+        )
+    return data
 
-def create_jinja_env(templates_dir):
-    """Create Jinja2 environment with templates."""
-    return Environment(
+
+def warn_if_slow_markupsafe():
+    """Warn when MarkupSafe is missing its C speedups extension."""
+    try:
+        # pylint: disable-next=import-outside-toplevel,unused-import
+        from markupsafe import _speedups  # noqa: F401
+    except ImportError:
+        print(
+            "Warning: install MarkupSafe with C extension for faster rendering",
+            file=sys.stderr,
+        )
+
+
+def create_jinja_env(templates_dir, cache_dir=None, autoescape=True):
+    """Create Jinja2 environment with templates, reusing one built earlier."""
+    cache_key = (
+        str(templates_dir),
+        None if cache_dir is None else str(cache_dir),
+        autoescape,
+    )
+    if cache_key in _ENV_CACHE:
+        return _ENV_CACHE[cache_key]
+
+    # pylint: disable-next=import-outside-toplevel
+    from jinja2 import (
+        Environment,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        select_autoescape,
+    )
+
+    # Reuse compiled template code across runs when a cache directory is given
+    bytecode_cache = None
+    if cache_dir is not None:
+        Path(cache_dir).mkdir(exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(directory=str(cache_dir))
+
+    env = _ENV_CACHE[cache_key] = Environment(
         loader=FileSystemLoader(templates_dir),
-        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=bytecode_cache,
+        autoescape=select_autoescape(["html", "xml"]) if autoescape else False,
         trim_blocks=True,
         lstrip_blocks=True,
+        # Templates do not change during a build: skip the per-lookup stat
+        # and keep every compiled template cached
+        auto_reload=False,
+        cache_size=-1,
     )
+    return env
+
 
+def render_page(template, data, extra_context, output_path):
+    """Render a single page to output_path and return a log line."""
+    # Stream encoded chunks into the file instead of building the whole page.
+    # data is passed per render rather than stored in the environment globals,
+    # which outlive this build in _ENV_CACHE; Jinja only shallow-copies its
+    # top-level keys, none of which clash with the page extras
+    with open(output_path, "wb") as file:
+        template.stream(data, **extra_context).dump(file, encoding="utf-8")
+    return f"Generated: {output_path}"
 
-def generate_pages(env, data, output_dir, api_endpoint):
-    """Generate all HTML pages."""
+
+def generate_pages(env, data, output_dir, api_endpoint, log):
+    """Generate all HTML pages, appending progress lines to log."""
     pages = [
         ("index.html", "index.html", {"page": "home"}),
         ("resume.html", "resume.html", {"page": "resume"}),
@@ -51,32 +158,132 @@ def generate_pages(env, data, output_dir, api_endpoint):
         ),
     ]
 
-    for template_name, output_name, extra_context in pages:
-        template = env.get_template(template_name)
-        context = {**data, **extra_context}
-        html = template.render(**context)
+    # Compile the page templates and their layouts before rendering so compile
+    # errors surface first and worker threads only hit the warm cache. Other
+    # files in the templates directory are never loaded.
+    templates = {
+        name: env.get_template(name)
+        for name in (*LAYOUT_TEMPLATES, *(page[0] for page in pages))
+    }
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pages))) as executor:
+        futures = [
+            executor.submit(
+                render_page,
+                templates[template_name],
+                data,
+                extra_context,
+                os.path.join(output_dir, output_name),
+            )
+            for template_name, output_name, extra_context in pages
+        ]
+        # Re-raise the first rendering error, if any; log in page order
+        for future in futures:
+            log.append(future.result())
+
+
+def _clone_file(in_fd, out_fd):
+    """Try to reflink the source into the destination; return True on success."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.ioctl(out_fd, FICLONE, in_fd)
+    except OSError:
+        return False
+    return True
+
 
-        output_path = output_dir / output_name
-        with open(output_path, "w", encoding="utf-8") as file:
-            file.write(html)
-        print(f"Generated: {output_path}")
+def _copy_file_range(in_fd, out_fd, size):
+    """Try an in-kernel copy with os.copy_file_range; return True on success."""
+    if not hasattr(os, "copy_file_range"):
+        return False
+    copied = 0
+    try:
+        while copied < size:
+            count = os.copy_file_range(in_fd, out_fd, size - copied)
+            if count == 0:
+                break
+            copied += count
+    except OSError:
+        # Unsupported here (e.g. across filesystems); fall back if nothing moved
+        if copied:
+            raise
+        return False
+    return True
+
+
+def fast_copy(src, dst):
+    """Copy a file and its metadata, preferring kernel-side copy mechanisms."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        if not _clone_file(in_fd, out_fd) and not _copy_file_range(in_fd, out_fd, size):
+            shutil.copyfileobj(fsrc, fdst, length=COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def is_up_to_date(src_stat, dest):
+    """Check whether dest already matches the source's size and mtime."""
+    try:
+        dest_stat = os.stat(dest)
+    except FileNotFoundError:
+        return False
+    return (
+        dest_stat.st_size == src_stat.st_size
+        and dest_stat.st_mtime_ns == src_stat.st_mtime_ns
+    )
 
 
-def copy_static_files(static_dir, output_dir):
-    """Copy static files (CSS, JS, images) to output directory."""
-    if not static_dir.exists():
+def copy_if_changed(src, dst):
+    """Copy src to dst with fast_copy unless dst already matches."""
+    if is_up_to_date(os.stat(src), dst):
+        return dst
+    return fast_copy(src, dst)
+
+
+def copy_static_item(item, dest):
+    """Copy a static file or directory (an os.DirEntry) to dest, skipping unchanged files.
+
+    Returns a log line, or None if the entry is neither a file nor a directory.
+    """
+    if item.is_file():
+        # fast_copy preserves mtime, so an unchanged file keeps matching
+        if is_up_to_date(item.stat(), dest):
+            return f"Unchanged: {dest}"
+        fast_copy(item.path, dest)
+        return f"Copied: {dest}"
+    if item.is_dir():
+        # Merge into the existing tree, rewriting only files that changed
+        shutil.copytree(
+            item.path, dest, dirs_exist_ok=True, copy_function=copy_if_changed
+        )
+        return f"Copied directory: {dest}"
+    return None
+
+
+def copy_static_files(static_dir, output_dir, log):
+    """Copy static files (CSS, JS, images) to output directory, logging to log."""
+    # os.scandir entries carry the file type from the directory listing, so
+    # the is_file()/is_dir() checks below need no extra stat calls
+    try:
+        with os.scandir(static_dir) as entries:
+            items = list(entries)
+    except FileNotFoundError:
+        return
+    if not items:
         return
 
-    for item in static_dir.iterdir():
-        dest = output_dir / item.name
-        if item.is_file():
-            shutil.copy2(item, dest)
-            print(f"Copied: {dest}")
-        elif item.is_dir():
-            if dest.exists():
-                shutil.rmtree(dest)
-            shutil.copytree(item, dest)
-            print(f"Copied directory: {dest}")
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as executor:
+        futures = [
+            executor.submit(copy_static_item, item, os.path.join(output_dir, item.name))
+            for item in items
+        ]
+        # Re-raise the first copy error, if any; log in listing order
+        for future in futures:
+            message = future.result()
+            if message:
+                log.append(message)
 
 
 def main():
@@ -99,6 +306,11 @@ def main():
         default="{{API_ENDPOINT}}",
         help="Contact form API endpoint (default: placeholder for CI injection)",
     )
+    parser.add_argument(
+        "--no-autoescape",
+        action="store_true",
+        help="Disable HTML autoescaping (only for trusted data)",
+    )
     args = parser.parse_args()
 
     # Resolve paths relative to script location
@@ -120,21 +332,37 @@ def main():
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load data
-    print(f"Loading data from: {data_path}")
-    data = load_resume_data(data_path)
+    # Hand plain strings to the per-file helpers, which join them with
+    # os.path.join rather than building a Path object per file
+    output_dir = str(output_dir)
+
+    # Collect progress lines and write them in one go at the end
+    log = []
+    try:
+        # Load data
+        log.append(f"Loading data from: {data_path}")
+        data = load_resume_data(data_path)
 
-    # Create Jinja environment
-    env = create_jinja_env(templates_dir)
+        # Create Jinja environment
+        if not args.no_autoescape:
+            warn_if_slow_markupsafe()
+        env = create_jinja_env(
+            templates_dir,
+            script_dir / ".jinja_cache",
+            autoescape=not args.no_autoescape,
+        )
 
-    # Generate pages
-    print(f"Generating pages to: {output_dir}")
-    generate_pages(env, data, output_dir, args.api_endpoint)
+        # Generate pages
+        log.append(f"Generating pages to: {output_dir}")
+        generate_pages(env, data, output_dir, args.api_endpoint, log)
 
-    # Copy static files
-    copy_static_files(static_dir, output_dir)
+        # Copy static files
+        copy_static_files(str(static_dir), output_dir, log)
 
-    print("Site generation complete!")
+        log.append("Site generation complete!")
+    finally:
+        # Flush whatever was logged, even when a step failed
+        sys.stdout.write("\n".join(log) + "\n")
 
 
 if __name__ == "__main__":